@@ -3,26 +3,42 @@
 from __future__ import annotations
 
 import asyncio
+import codecs
+import hashlib
 import os
+import pickle
+import re
 import secrets
 import shutil
 import signal
+import stat
 import subprocess
+import sys
+import threading
+import time
 import psutil
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import orjson
 import yaml
 from starlette.applications import Starlette
-from starlette.responses import JSONResponse, HTMLResponse, Response
+from starlette.responses import FileResponse, JSONResponse, HTMLResponse, Response, StreamingResponse
 from starlette.routing import Route, Mount
 from starlette.staticfiles import StaticFiles
 from starlette.templating import Jinja2Templates
 from starlette.middleware import Middleware
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.requests import Request
 import base64
 
+try:
+    from yaml import CSafeLoader, CSafeDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as CSafeLoader, SafeDumper as CSafeDumper
+
 from sleepless_agent.utils.config import get_config, CONFIG_ENV_VAR, DEFAULT_CONFIG_NAME
 from sleepless_agent.monitoring.logging import get_logger
 
@@ -31,14 +47,49 @@ logger = get_logger(__name__)
 # Basic auth credentials from environment variables
 WEBUI_USERNAME = os.environ.get("WEBUI_USERNAME", "admin")
 WEBUI_PASSWORD = os.environ.get("WEBUI_PASSWORD", "")  # Empty means no auth
+# Credentials are fixed for the process, so the expected header is built once
+_EXPECTED_AUTH = b"Basic " + base64.b64encode(f"{WEBUI_USERNAME}:{WEBUI_PASSWORD}".encode("utf-8"))
 
 # Process tracking for daemon
 DAEMON_PROCESS: subprocess.Popen | None = None
 DAEMON_PID_FILE = Path.home() / ".sleepless-agent" / "daemon.pid"
 
+# User-private directory holding pickled snapshots of parsed config files
+CONFIG_CACHE_DIR = Path.home() / ".sleepless-agent" / "cache"
+
+# Parsed config keyed by the file's (mtime_ns, size) so unchanged files skip the YAML parse
+_CONFIG_CACHE: tuple[tuple[int, int], dict[str, Any]] | None = None
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+# Result of the last daemon check, reused for STATUS_CACHE_TTL seconds
+STATUS_CACHE_TTL = 1.5
+# Delays between checks for a freshly started daemon (about 1.5s in total)
+START_POLL_DELAYS = (0.05, 0.1, 0.2, 0.4, 0.8)
+# Seconds a started daemon must stay up before the start is reported as successful
+START_SETTLE_TIME = 1.0
+_STATUS_CACHE: tuple[float, tuple[bool, int | None]] | None = None
+
+# Command-line patterns identifying a daemon process, and the executable names
+# worth joining the cmdline for (interpreters are matched by prefix, e.g. python3.11)
+_DAEMON_RE = re.compile(r"sle daemon|sleepless-agent daemon|sleepless_agent\.core\.daemon")
+_DAEMON_EXE = frozenset({"sle", "sleepless-agent"})
+_DAEMON_CMDLINE_RE = re.compile(_DAEMON_RE.pattern.encode())
+
 
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson instead of the stdlib encoder."""
+    
+    def render(self, content: Any) -> bytes:
+        # Non-string keys are allowed so YAML mappings with int keys still serialize
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+@lru_cache(maxsize=1)
 def get_config_path() -> Path:
-    """Get the path to the configuration file."""
+    """Get the path to the configuration file.
+    
+    The result is cached for the life of the process; send SIGHUP to look it up again.
+    """
     config_path_str = os.environ.get(CONFIG_ENV_VAR)
     if config_path_str:
         return Path(config_path_str).expanduser().resolve()
@@ -59,17 +110,105 @@ def get_config_path() -> Path:
 
 
 def load_config_file() -> dict[str, Any]:
-    """Load the configuration from file."""
+    """Load the configuration from file, reusing the cached parse if unchanged."""
+    global _CONFIG_CACHE
     config_path = get_config_path()
+    stamp = _config_stamp(config_path)
+    # Hits read the cache tuple without locking; only misses serialize on the parse
+    cached = _CONFIG_CACHE
+    if cached is not None and cached[0] == stamp:
+        return cached[1].copy()
+    with _CONFIG_CACHE_LOCK:
+        if _CONFIG_CACHE is not None and _CONFIG_CACHE[0] == stamp:
+            return _CONFIG_CACHE[1].copy()
+        config = _read_config(config_path, stamp)
+        _CONFIG_CACHE = (stamp, config)
+        return config.copy()
+
+
+def _config_stamp(config_path: Path) -> tuple[int, int]:
+    """Get the (mtime_ns, size) pair identifying the current config file contents."""
+    st = config_path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _pickle_cache_path(config_path: Path) -> Path:
+    """Get the path of the pickled snapshot for a config file in CONFIG_CACHE_DIR."""
+    key = hashlib.sha256(str(config_path.resolve()).encode("utf-8")).hexdigest()[:16]
+    return CONFIG_CACHE_DIR / f"config-{key}.pkl"
+
+
+def _read_config(config_path: Path, stamp: tuple[int, int]) -> dict[str, Any]:
+    """Parse the config file, using the pickled snapshot if it matches stamp."""
+    pickle_path = _pickle_cache_path(config_path)
+    try:
+        with pickle_path.open("rb") as f:
+            cached_stamp, config = pickle.load(f)
+        if cached_stamp == stamp and isinstance(config, dict):
+            return config
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        # The snapshot is only an optimisation; drop a bad one and reparse the YAML
+        logger.debug(f"Ignoring unreadable config cache {pickle_path}: {e}")
+        try:
+            pickle_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+    
     with config_path.open("r") as f:
-        return yaml.safe_load(f) or {}
+        config = yaml.load(f, Loader=CSafeLoader) or {}
+    
+    # Write the snapshot atomically and readable only by this user, since it is unpickled
+    tmp_path = pickle_path.with_name(pickle_path.name + ".tmp")
+    try:
+        CONFIG_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_path.unlink(missing_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((stamp, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, pickle_path)
+    except OSError as e:
+        logger.debug(f"Could not write config cache {pickle_path}: {e}")
+    return config
 
 
 def save_config_file(config_data: dict[str, Any]) -> None:
     """Save the configuration to file."""
+    global _CONFIG_CACHE, _WORKSPACE_CACHE
     config_path = get_config_path()
-    with config_path.open("w") as f:
-        yaml.dump(config_data, f, default_flow_style=False, sort_keys=False)
+    # Emit to bytes first, then write once and rename so a crash never leaves a partial file
+    data = yaml.dump(
+        config_data, Dumper=CSafeDumper, default_flow_style=False, sort_keys=False, encoding="utf-8"
+    )
+    # Replace the file a symlinked config points at, not the link itself
+    target_path = config_path.resolve()
+    with _CONFIG_CACHE_LOCK:
+        tmp_path, f = _open_temp_sibling(target_path)
+        try:
+            with f:
+                f.write(data)
+            os.replace(tmp_path, target_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        _CONFIG_CACHE = None
+        _WORKSPACE_CACHE = None
+        _pickle_cache_path(config_path).unlink(missing_ok=True)
+
+
+# Constant 401 responses, built once and reused. Response sends its raw_headers
+# list as-is, so no middleware outside BasicAuthMiddleware may modify headers.
+_AUTH_REQUIRED_RESPONSE = Response(
+    content="Authentication required",
+    status_code=401,
+    headers={"WWW-Authenticate": 'Basic realm="Sleepless Agent WebUI"'}
+)
+_AUTH_INVALID_RESPONSE = Response(
+    content="Invalid credentials",
+    status_code=401,
+    headers={"WWW-Authenticate": 'Basic realm="Sleepless Agent WebUI"'}
+)
 
 
 class BasicAuthMiddleware(BaseHTTPMiddleware):
@@ -80,71 +219,129 @@ class BasicAuthMiddleware(BaseHTTPMiddleware):
         if not WEBUI_PASSWORD:
             return await call_next(request)
         
-        # Skip auth for static files
-        if request.url.path.startswith("/static"):
+        # Skip auth for CORS preflight requests
+        if request.method == "OPTIONS":
             return await call_next(request)
         
-        # Check for Authorization header
-        auth_header = request.headers.get("Authorization")
+        # Check for Authorization header, read as raw bytes to skip decoding
+        auth_header = next(
+            (value for key, value in request.headers.raw if key == b"authorization"), None
+        )
         
-        if not auth_header or not auth_header.startswith("Basic "):
-            return Response(
-                content="Authentication required",
-                status_code=401,
-                headers={"WWW-Authenticate": 'Basic realm="Sleepless Agent WebUI"'}
-            )
+        if not auth_header or not auth_header.startswith(b"Basic "):
+            return _AUTH_REQUIRED_RESPONSE
         
-        try:
-            # Decode credentials
-            credentials = base64.b64decode(auth_header[6:]).decode("utf-8")
-            username, password = credentials.split(":", 1)
-            
-            # Verify credentials using constant-time comparison to prevent timing attacks
-            username_match = secrets.compare_digest(username, WEBUI_USERNAME)
-            password_match = secrets.compare_digest(password, WEBUI_PASSWORD)
-            
-            if username_match and password_match:
-                return await call_next(request)
-        except Exception as e:
-            logger.error(f"Auth error: {e}")
+        # Verify the whole header using constant-time comparison to prevent timing attacks
+        if secrets.compare_digest(auth_header, _EXPECTED_AUTH):
+            return await call_next(request)
         
         # Authentication failed
-        return Response(
-            content="Invalid credentials",
-            status_code=401,
-            headers={"WWW-Authenticate": 'Basic realm="Sleepless Agent WebUI"'}
-        )
+        return _AUTH_INVALID_RESPONSE
 
 
 def is_daemon_running() -> tuple[bool, int | None]:
-    """Check if the daemon process is running."""
-    # First check PID file
-    if DAEMON_PID_FILE.exists():
+    """Check if the daemon process is running.
+    
+    Results are reused for STATUS_CACHE_TTL seconds so bursty status polling
+    collapses into one real check.
+    """
+    global _STATUS_CACHE
+    now = time.monotonic()
+    cached = _STATUS_CACHE
+    if cached is not None and now - cached[0] < STATUS_CACHE_TTL:
+        return cached[1]
+    result = _check_daemon()
+    _STATUS_CACHE = (now, result)
+    return result
+
+
+def _check_daemon() -> tuple[bool, int | None]:
+    """Check the PID file first, then fall back to scanning processes."""
+    # Fast path: verify the PID recorded in the PID file
+    pid = _read_pid_file()
+    if pid is not None:
         try:
-            pid = int(DAEMON_PID_FILE.read_text().strip())
-            if psutil.pid_exists(pid):
+            if _pid_alive(pid):
                 proc = psutil.Process(pid)
+                # Batch the /proc reads for this process
+                with proc.oneshot():
+                    cmdline = proc.cmdline()
                 # Verify it's actually our daemon by checking for exact command pattern
-                cmdline = proc.cmdline()
                 if len(cmdline) >= 2 and cmdline[0].endswith('python') and 'sle' in cmdline[1] and 'daemon' in cmdline:
                     return True, pid
                 # Alternative check for direct invocation
-                if 'sleepless_agent' in ' '.join(cmdline) and 'daemon' in cmdline:
+                if 'daemon' in cmdline and any('sleepless_agent' in arg for arg in cmdline):
                     return True, pid
-        except (ValueError, psutil.NoSuchProcess, psutil.AccessDenied):
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
             pass
     
-    # Check if there's a global daemon running by looking for specific command pattern
+    # Slow path: look for a daemon started outside the web UI
+    return _scan_for_daemon()
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a process with this PID exists, using a single syscall on POSIX."""
+    if pid <= 0:
+        return False
+    if sys.platform == "win32":
+        # Signal 0 means CTRL_C_EVENT on Windows, so ask psutil instead
+        return psutil.pid_exists(pid)
+    try:
+        os.kill(pid, 0)
+    except (ProcessLookupError, PermissionError):
+        # PermissionError: the PID belongs to another user, so it isn't our daemon
+        return False
+    return True
+
+
+def _scan_for_daemon() -> tuple[bool, int | None]:
+    """Scan all processes for a daemon started outside the web UI."""
+    if sys.platform.startswith("linux"):
+        try:
+            pid = _find_daemon_linux()
+            return pid is not None, pid
+        except OSError as e:
+            logger.debug(f"Falling back to psutil process scan: {e}")
+    return _find_daemon_psutil()
+
+
+def _find_daemon_linux() -> int | None:
+    """Find the daemon by reading /proc/<pid>/cmdline directly, stopping at the first match."""
+    with os.scandir("/proc") as it:
+        for entry in it:
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry.name}/cmdline", "rb") as f:
+                    cmdline = f.read()
+            except OSError:
+                # Process exited or is not readable
+                continue
+            # Every daemon pattern contains "daemon"; skip the rest before joining
+            if b"daemon" not in cmdline:
+                continue
+            # Arguments are NUL-separated; join them with spaces like the psutil scan
+            if _DAEMON_CMDLINE_RE.search(cmdline.replace(b"\0", b" ")):
+                return int(entry.name)
+    return None
+
+
+def _find_daemon_psutil() -> tuple[bool, int | None]:
+    """Scan for the daemon through psutil on platforms without /proc."""
+    # Attributes are prefetched by process_iter, so only proc.info is read
     for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
         try:
-            cmdline = proc.info.get('cmdline', [])
-            if not cmdline:
+            # Skip processes that can't be the daemon before building the cmdline string
+            name = (proc.info['name'] or '').lower()
+            if name not in _DAEMON_EXE and not name.startswith('python'):
+                continue
+            cmdline = proc.info['cmdline']
+            # Every daemon pattern contains "daemon"; skip the rest before joining
+            if not cmdline or not any('daemon' in arg for arg in cmdline):
                 continue
             
             # Look for exact 'sle daemon' or 'sleepless-agent daemon' pattern
-            cmdline_str = ' '.join(cmdline)
-            if ('sle daemon' in cmdline_str or 'sleepless-agent daemon' in cmdline_str or 
-                'sleepless_agent.core.daemon' in cmdline_str):
+            if _DAEMON_RE.search(' '.join(cmdline)):
                 return True, proc.info['pid']
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             continue
@@ -152,10 +349,33 @@ def is_daemon_running() -> tuple[bool, int | None]:
     return False, None
 
 
+def invalidate_status_cache() -> None:
+    """Drop the cached daemon status so the next check is fresh."""
+    global _STATUS_CACHE
+    _STATUS_CACHE = None
+
+
+def _read_pid_file() -> int | None:
+    """Read the daemon PID file with a single read, or None if missing or invalid."""
+    try:
+        fd = os.open(DAEMON_PID_FILE, os.O_RDONLY)
+        try:
+            data = os.read(fd, 32)
+        finally:
+            os.close(fd)
+        return int(data.strip() or 0) or None
+    except (OSError, ValueError):
+        return None
+
+
 def save_daemon_pid(pid: int) -> None:
     """Save the daemon PID to file."""
     DAEMON_PID_FILE.parent.mkdir(parents=True, exist_ok=True)
-    DAEMON_PID_FILE.write_text(str(pid))
+    fd = os.open(DAEMON_PID_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, str(pid).encode("ascii"))
+    finally:
+        os.close(fd)
 
 
 def clear_daemon_pid() -> None:
@@ -167,38 +387,42 @@ def clear_daemon_pid() -> None:
 # Get the directory where this file is located
 CURRENT_DIR = Path(__file__).parent
 templates = Jinja2Templates(directory=str(CURRENT_DIR / "templates"))
+# Compiled once at import and rendered directly, skipping the per-request
+# template lookup and Starlette's TemplateResponse wrapper
+INDEX_TMPL = templates.get_template("index.html")
+FILES_TMPL = templates.get_template("files.html")
 
 
 async def homepage(request):
     """Render the main configuration page."""
-    config = load_config_file()
-    return templates.TemplateResponse(
-        "index.html",
-        {
-            "request": request,
-            "config": config,
-        }
-    )
+    config = await asyncio.to_thread(load_config_file)
+    return HTMLResponse(INDEX_TMPL.render(request=request, config=config))
 
 
 async def files_page(request):
     """Render the file browser page."""
-    return templates.TemplateResponse(
-        "files.html",
-        {
-            "request": request,
-        }
-    )
+    return HTMLResponse(FILES_TMPL.render(request=request))
 
 
 async def get_config_endpoint(request):
-    """API endpoint to get current configuration."""
+    """API endpoint to get current configuration.
+    
+    Responses carry an ETag derived from the config file's mtime and size,
+    so clients revalidating an unchanged config get an empty 304.
+    """
     try:
-        config = load_config_file()
-        return JSONResponse({"success": True, "config": config})
-    except Exception as e:
+        st = get_config_path().stat()
+        etag = f'W/"{st.st_mtime_ns}-{st.st_size}"'
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if_none_match = request.headers.get("If-None-Match", "")
+        if etag in (tag.strip() for tag in if_none_match.split(",")):
+            return Response(status_code=304, headers=headers)
+        
+        config = await asyncio.to_thread(load_config_file)
+        return ORJSONResponse({"success": True, "config": config}, headers=headers)
+    except (OSError, yaml.YAMLError) as e:
         logger.error(f"Error loading config: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             {"success": False, "error": str(e)},
             status_code=500
         )
@@ -207,41 +431,48 @@ async def get_config_endpoint(request):
 async def update_config_endpoint(request):
     """API endpoint to update configuration."""
     try:
-        data = await request.json()
+        data = orjson.loads(await request.body())
         config_data = data.get("config", {})
         
         # Validate the config structure
         if not isinstance(config_data, dict):
-            return JSONResponse(
+            return ORJSONResponse(
                 {"success": False, "error": "Invalid config format"},
                 status_code=400
             )
         
         # Save the configuration
-        save_config_file(config_data)
+        await asyncio.to_thread(save_config_file, config_data)
         logger.info("Configuration updated successfully")
         
-        return JSONResponse({"success": True, "message": "Configuration updated successfully"})
-    except Exception as e:
+        return ORJSONResponse({"success": True, "message": "Configuration updated successfully"})
+    except (ValueError, OSError, yaml.YAMLError) as e:
         logger.error(f"Error updating config: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             {"success": False, "error": str(e)},
             status_code=500
         )
 
 
+async def config_endpoint(request):
+    """Dispatch /api/config by method so the router matches the path once."""
+    if request.method == "POST":
+        return await update_config_endpoint(request)
+    return await get_config_endpoint(request)
+
+
 async def get_agent_status(request):
     """API endpoint to get agent daemon status."""
     try:
         running, pid = is_daemon_running()
-        return JSONResponse({
+        return ORJSONResponse({
             "success": True,
             "running": running,
             "pid": pid
         })
-    except Exception as e:
+    except (psutil.Error, OSError, subprocess.SubprocessError) as e:
         logger.error(f"Error getting agent status: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             {"success": False, "error": str(e)},
             status_code=500
         )
@@ -252,9 +483,10 @@ async def start_agent(request):
     global DAEMON_PROCESS
     
     try:
+        invalidate_status_cache()
         running, _ = is_daemon_running()
         if running:
-            return JSONResponse(
+            return ORJSONResponse(
                 {"success": False, "error": "Agent is already running"},
                 status_code=400
             )
@@ -265,23 +497,50 @@ async def start_agent(request):
         stdout_log = log_dir / "daemon_stdout.log"
         stderr_log = log_dir / "daemon_stderr.log"
         
-        # Start daemon in detached mode with logging
-        DAEMON_PROCESS = subprocess.Popen(
-            ["sle", "daemon"],
-            stdout=open(stdout_log, 'a'),
-            stderr=open(stderr_log, 'a'),
-            start_new_session=True
-        )
+        # Start daemon in detached mode with logging. The child gets its own
+        # copies of the log descriptors, so the parent closes them right away.
+        log_flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+        stdout_fd = os.open(stdout_log, log_flags, 0o644)
+        try:
+            stderr_fd = os.open(stderr_log, log_flags, 0o644)
+            try:
+                DAEMON_PROCESS = subprocess.Popen(
+                    ["sle", "daemon"],
+                    stdout=stdout_fd,
+                    stderr=stderr_fd,
+                    start_new_session=True
+                )
+            finally:
+                os.close(stderr_fd)
+        finally:
+            os.close(stdout_fd)
         
-        # Give it a moment to start
-        await asyncio.sleep(1)
+        # Poll with backoff until the daemon shows up, giving up early if it exits
+        started = time.monotonic()
+        running, pid = False, None
+        for delay in START_POLL_DELAYS:
+            await asyncio.sleep(delay)
+            invalidate_status_cache()
+            running, pid = is_daemon_running()
+            if running or DAEMON_PROCESS.poll() is not None:
+                break
+        
+        # The process is visible as soon as it is exec'd, so keep watching it until
+        # the settle time has passed to catch daemons that crash during init
+        while running and DAEMON_PROCESS.poll() is None:
+            remaining = START_SETTLE_TIME - (time.monotonic() - started)
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(remaining, 0.1))
+        if DAEMON_PROCESS.poll() is not None:
+            invalidate_status_cache()
+            running, pid = False, None
         
         # Verify it started
-        running, pid = is_daemon_running()
         if running and pid:
             save_daemon_pid(pid)
             logger.info(f"Agent daemon started with PID {pid}. Logs: {stdout_log}, {stderr_log}")
-            return JSONResponse({"success": True, "pid": pid})
+            return ORJSONResponse({"success": True, "pid": pid})
         else:
             # Read error logs if start failed
             error_msg = "Failed to start agent"
@@ -290,15 +549,15 @@ async def start_agent(request):
                     recent_errors = stderr_log.read_text().strip().split('\n')[-5:]
                     if recent_errors:
                         error_msg += f". Recent errors: {'; '.join(recent_errors)}"
-                except Exception:
+                except (OSError, UnicodeDecodeError):
                     pass
-            return JSONResponse(
+            return ORJSONResponse(
                 {"success": False, "error": error_msg},
                 status_code=500
             )
-    except Exception as e:
+    except (psutil.Error, OSError, subprocess.SubprocessError) as e:
         logger.error(f"Error starting agent: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             {"success": False, "error": str(e)},
             status_code=500
         )
@@ -309,9 +568,10 @@ async def stop_agent(request):
     global DAEMON_PROCESS
     
     try:
+        invalidate_status_cache()
         running, pid = is_daemon_running()
         if not running:
-            return JSONResponse(
+            return ORJSONResponse(
                 {"success": False, "error": "Agent is not running"},
                 status_code=400
             )
@@ -322,30 +582,70 @@ async def stop_agent(request):
                 proc = psutil.Process(pid)
                 proc.terminate()
                 
-                # Wait for graceful shutdown
-                await asyncio.sleep(2)
-                
-                # Force kill if still running
-                if proc.is_running():
+                # Wait for graceful shutdown, returning as soon as the process exits
+                try:
+                    await asyncio.to_thread(proc.wait, 2)
+                except psutil.TimeoutExpired:
+                    # Force kill if still running
                     proc.kill()
+                    try:
+                        await asyncio.to_thread(proc.wait, 1)
+                    except psutil.TimeoutExpired:
+                        logger.warning(f"Agent daemon (PID {pid}) did not exit after kill")
                 
                 clear_daemon_pid()
                 logger.info(f"Agent daemon stopped (PID {pid})")
             except psutil.NoSuchProcess:
                 clear_daemon_pid()
         
+        invalidate_status_cache()
         DAEMON_PROCESS = None
-        return JSONResponse({"success": True})
-    except Exception as e:
+        return ORJSONResponse({"success": True})
+    except (psutil.Error, OSError, subprocess.SubprocessError) as e:
         logger.error(f"Error stopping agent: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             {"success": False, "error": str(e)},
             status_code=500
         )
 
 
+# Resolved workspace root and its path prefix ("<root>/"), keyed by the config file's (mtime_ns, size)
+_WORKSPACE_CACHE: tuple[tuple[int, int], Path, str] | None = None
+
+# Directories with more entries than this are streamed as NDJSON to clients
+# that accept it, written in batches of BROWSE_STREAM_BATCH lines
+BROWSE_STREAM_THRESHOLD = 1000
+BROWSE_STREAM_BATCH = 256
+
+# Files larger than this are streamed as text/plain rather than embedded in JSON
+READ_INLINE_LIMIT = 1024 * 1024
+# Chunk size used to check a large file is UTF-8 before streaming it
+READ_CHECK_CHUNK = 64 * 1024
+
+
 def get_workspace_root() -> Path:
-    """Get the workspace root path from configuration."""
+    """Get the workspace root path, cached until the config file changes."""
+    global _WORKSPACE_CACHE
+    try:
+        stamp = _config_stamp(get_config_path())
+    except OSError:
+        return _resolve_workspace_root()
+    
+    cached = _WORKSPACE_CACHE
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    workspace_root = _resolve_workspace_root()
+    _WORKSPACE_CACHE = (stamp, workspace_root, _path_prefix(str(workspace_root)))
+    return workspace_root
+
+
+def _path_prefix(resolved: str) -> str:
+    """Get the string every path inside the resolved directory starts with."""
+    return resolved.rstrip(os.sep) + os.sep
+
+
+def _resolve_workspace_root() -> Path:
+    """Resolve and create the workspace root from configuration."""
     try:
         config = get_config()
         workspace_root = Path(config.agent.workspace_root).expanduser().resolve()
@@ -362,15 +662,89 @@ def get_workspace_root() -> Path:
 def is_path_safe(base_path: Path, target_path: Path) -> bool:
     """Check if target_path is within base_path to prevent directory traversal attacks."""
     try:
-        # Resolve both paths to absolute paths
-        base_resolved = base_path.resolve()
-        target_resolved = target_path.resolve()
-        # Check if target is within base
-        return target_resolved.is_relative_to(base_resolved)
+        # The cached workspace root is already resolved; other bases are resolved here
+        cached = _WORKSPACE_CACHE
+        if cached is not None and cached[1] is base_path:
+            base_resolved, base_prefix = str(base_path), cached[2]
+        else:
+            base_resolved = os.path.realpath(base_path)
+            base_prefix = _path_prefix(base_resolved)
+        # Check if target is within base with a single realpath and a prefix test
+        target_resolved = os.path.realpath(target_path)
+        return target_resolved == base_resolved or target_resolved.startswith(base_prefix)
     except (ValueError, OSError):
         return False
 
 
+def _read_utf8(path: Path) -> str:
+    """Read and decode a UTF-8 file; raises UnicodeDecodeError for binary files."""
+    return path.read_bytes().decode("utf-8")
+
+
+def _check_utf8(path: Path) -> None:
+    """Raise UnicodeDecodeError if the file is not UTF-8 text, reading it in chunks."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    with path.open("rb") as f:
+        while chunk := f.read(READ_CHECK_CHUNK):
+            decoder.decode(chunk)
+    decoder.decode(b"", final=True)
+
+
+def _open_temp_sibling(target_path: Path):
+    """Create a temp file next to target_path, keeping the target's permissions."""
+    tmp_path = target_path.with_name(f".{target_path.name}.{secrets.token_hex(4)}.tmp")
+    f = tmp_path.open("xb")
+    try:
+        os.chmod(tmp_path, stat.S_IMODE(target_path.stat().st_mode))
+    except FileNotFoundError:
+        pass
+    return tmp_path, f
+
+
+async def _stream_to_file(request: Request, target_path: Path) -> None:
+    """Stream the request body into target_path, replacing it atomically."""
+    tmp_path, f = await asyncio.to_thread(_open_temp_sibling, target_path)
+    try:
+        with f:
+            async for chunk in request.stream():
+                if chunk:
+                    await asyncio.to_thread(f.write, chunk)
+        await asyncio.to_thread(os.replace, tmp_path, target_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _listing_item(entry: os.DirEntry, prefix: str) -> dict[str, Any] | None:
+    """Describe a directory entry for browse_files, or None if it can't be read."""
+    try:
+        is_dir = entry.is_dir()
+        item_data = {
+            "name": entry.name,
+            "path": prefix + entry.name,
+            "type": "directory" if is_dir else "file",
+        }
+        if not is_dir and entry.is_file():
+            item_data["size"] = entry.stat().st_size
+        return item_data
+    except OSError:
+        return None
+
+
+def _iter_listing_ndjson(header: dict[str, Any], entries: list[os.DirEntry], prefix: str):
+    """Yield a directory listing as NDJSON: the header line, then one line per entry."""
+    lines = [orjson.dumps(header)]
+    for entry in entries:
+        item = _listing_item(entry, prefix)
+        if item is not None:
+            lines.append(orjson.dumps(item))
+        if len(lines) >= BROWSE_STREAM_BATCH:
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+
 async def browse_files(request):
     """API endpoint to browse files and folders in the workspace."""
     try:
@@ -386,20 +760,20 @@ async def browse_files(request):
         
         # Security check
         if not is_path_safe(workspace_root, target_path):
-            return JSONResponse(
+            return ORJSONResponse(
                 {"success": False, "error": "Access denied: path outside workspace"},
                 status_code=403
             )
         
         if not target_path.exists():
-            return JSONResponse(
+            return ORJSONResponse(
                 {"success": False, "error": "Path does not exist"},
                 status_code=404
             )
         
         if target_path.is_file():
             # Return file metadata
-            return JSONResponse({
+            return ORJSONResponse({
                 "success": True,
                 "type": "file",
                 "name": target_path.name,
@@ -407,31 +781,34 @@ async def browse_files(request):
                 "size": target_path.stat().st_size,
             })
         else:
-            # List directory contents
-            items = []
-            for item in sorted(target_path.iterdir()):
-                try:
-                    relative_path = str(item.relative_to(workspace_root))
-                    item_data = {
-                        "name": item.name,
-                        "path": relative_path,
-                        "type": "directory" if item.is_dir() else "file",
-                    }
-                    if item.is_file():
-                        item_data["size"] = item.stat().st_size
-                    items.append(item_data)
-                except (OSError, ValueError):
-                    continue
+            # List directory contents; scandir entries reuse the file type
+            # from the directory read instead of a stat per check
+            with os.scandir(target_path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
             
-            return JSONResponse({
+            # target_path is known to be inside workspace_root, so its relative
+            # path is a plain string slice and entry paths are prefix + name
+            dir_path = str(target_path)[len(str(workspace_root).rstrip(os.sep)) + 1:]
+            prefix = dir_path + "/" if dir_path else ""
+            header = {
                 "success": True,
                 "type": "directory",
-                "path": str(target_path.relative_to(workspace_root)) if target_path != workspace_root else "",
-                "items": items,
-            })
-    except Exception as e:
+                "path": dir_path,
+            }
+            
+            # Stream large listings as NDJSON when the client accepts it
+            if (len(entries) > BROWSE_STREAM_THRESHOLD
+                    and "application/x-ndjson" in request.headers.get("Accept", "")):
+                return StreamingResponse(
+                    _iter_listing_ndjson(header, entries, prefix),
+                    media_type="application/x-ndjson",
+                )
+            
+            items = [item for item in (_listing_item(entry, prefix) for entry in entries) if item is not None]
+            return ORJSONResponse({**header, "items": items})
+    except (OSError, ValueError) as e:
         logger.error(f"Error browsing files: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             {"success": False, "error": str(e)},
             status_code=500
         )
@@ -445,7 +822,7 @@ async def read_file(request):
         # Get path parameter from query string
         path_param = request.query_params.get("path", "")
         if not path_param:
-            return JSONResponse(
+            return ORJSONResponse(
                 {"success": False, "error": "Path parameter required"},
                 status_code=400
             )
@@ -454,57 +831,71 @@ async def read_file(request):
         
         # Security check
         if not is_path_safe(workspace_root, target_path):
-            return JSONResponse(
+            return ORJSONResponse(
                 {"success": False, "error": "Access denied: path outside workspace"},
                 status_code=403
             )
         
         if not target_path.exists():
-            return JSONResponse(
+            return ORJSONResponse(
                 {"success": False, "error": "File does not exist"},
                 status_code=404
             )
         
         if not target_path.is_file():
-            return JSONResponse(
+            return ORJSONResponse(
                 {"success": False, "error": "Path is not a file"},
                 status_code=400
             )
         
-        # Read file content
+        # Read file content off the event loop
         try:
-            content = target_path.read_text(encoding="utf-8")
-            return JSONResponse({
+            size = target_path.stat().st_size
+            if size > READ_INLINE_LIMIT:
+                # Stream large text files instead of embedding them in JSON
+                await asyncio.to_thread(_check_utf8, target_path)
+                return FileResponse(target_path, media_type="text/plain; charset=utf-8")
+            content = await asyncio.to_thread(_read_utf8, target_path)
+            return ORJSONResponse({
                 "success": True,
                 "content": content,
                 "path": str(target_path.relative_to(workspace_root)),
-                "size": target_path.stat().st_size,
+                "size": size,
             })
         except UnicodeDecodeError:
             # Binary file
-            return JSONResponse(
+            return ORJSONResponse(
                 {"success": False, "error": "File is binary and cannot be edited in the web UI"},
                 status_code=400
             )
-    except Exception as e:
+    except (OSError, ValueError) as e:
         logger.error(f"Error reading file: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             {"success": False, "error": str(e)},
             status_code=500
         )
 
 
 async def write_file(request):
-    """API endpoint to write/update file contents."""
+    """API endpoint to write/update file contents.
+    
+    Accepts either a JSON body with ``path`` and ``content``, or the raw file
+    content as the body with ``path`` in the query string. The raw form is
+    streamed to disk without buffering the whole payload.
+    """
     try:
         workspace_root = get_workspace_root()
         
-        data = await request.json()
-        path_param = data.get("path", "")
-        content = data.get("content", "")
+        # A path in the query string selects the streamed form; anything else is JSON
+        path_param = request.query_params.get("path", "")
+        streamed = bool(path_param)
+        if not streamed:
+            data = orjson.loads(await request.body())
+            path_param = data.get("path", "")
+            content = data.get("content", "")
         
         if not path_param:
-            return JSONResponse(
+            return ORJSONResponse(
                 {"success": False, "error": "Path parameter required"},
                 status_code=400
             )
@@ -513,7 +904,7 @@ async def write_file(request):
         
         # Security check
         if not is_path_safe(workspace_root, target_path):
-            return JSONResponse(
+            return ORJSONResponse(
                 {"success": False, "error": "Access denied: path outside workspace"},
                 status_code=403
             )
@@ -522,17 +913,20 @@ async def write_file(request):
         target_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Write file content
-        target_path.write_text(content, encoding="utf-8")
+        if streamed:
+            await _stream_to_file(request, target_path)
+        else:
+            await asyncio.to_thread(target_path.write_text, content, encoding="utf-8")
         logger.info(f"File written: {target_path.relative_to(workspace_root)}")
         
-        return JSONResponse({
+        return ORJSONResponse({
             "success": True,
             "message": "File saved successfully",
             "path": str(target_path.relative_to(workspace_root)),
         })
-    except Exception as e:
+    except (OSError, ValueError) as e:
         logger.error(f"Error writing file: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             {"success": False, "error": str(e)},
             status_code=500
         )
@@ -543,11 +937,11 @@ async def create_folder(request):
     try:
         workspace_root = get_workspace_root()
         
-        data = await request.json()
+        data = orjson.loads(await request.body())
         path_param = data.get("path", "")
         
         if not path_param:
-            return JSONResponse(
+            return ORJSONResponse(
                 {"success": False, "error": "Path parameter required"},
                 status_code=400
             )
@@ -556,13 +950,13 @@ async def create_folder(request):
         
         # Security check
         if not is_path_safe(workspace_root, target_path):
-            return JSONResponse(
+            return ORJSONResponse(
                 {"success": False, "error": "Access denied: path outside workspace"},
                 status_code=403
             )
         
         if target_path.exists():
-            return JSONResponse(
+            return ORJSONResponse(
                 {"success": False, "error": "Path already exists"},
                 status_code=400
             )
@@ -571,14 +965,14 @@ async def create_folder(request):
         target_path.mkdir(parents=True, exist_ok=True)
         logger.info(f"Folder created: {target_path.relative_to(workspace_root)}")
         
-        return JSONResponse({
+        return ORJSONResponse({
             "success": True,
             "message": "Folder created successfully",
             "path": str(target_path.relative_to(workspace_root)),
         })
-    except Exception as e:
+    except (OSError, ValueError) as e:
         logger.error(f"Error creating folder: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             {"success": False, "error": str(e)},
             status_code=500
         )
@@ -589,11 +983,11 @@ async def delete_path(request):
     try:
         workspace_root = get_workspace_root()
         
-        data = await request.json()
+        data = orjson.loads(await request.body())
         path_param = data.get("path", "")
         
         if not path_param:
-            return JSONResponse(
+            return ORJSONResponse(
                 {"success": False, "error": "Path parameter required"},
                 status_code=400
             )
@@ -602,49 +996,57 @@ async def delete_path(request):
         
         # Security check
         if not is_path_safe(workspace_root, target_path):
-            return JSONResponse(
+            return ORJSONResponse(
                 {"success": False, "error": "Access denied: path outside workspace"},
                 status_code=403
             )
         
         if not target_path.exists():
-            return JSONResponse(
+            return ORJSONResponse(
                 {"success": False, "error": "Path does not exist"},
                 status_code=404
             )
         
         # Don't allow deleting the workspace root itself
         if target_path == workspace_root:
-            return JSONResponse(
+            return ORJSONResponse(
                 {"success": False, "error": "Cannot delete workspace root"},
                 status_code=403
             )
         
-        # Delete file or folder
+        # Delete file or folder in a worker thread so large trees don't block the event loop
         if target_path.is_dir():
-            shutil.rmtree(target_path)
+            await asyncio.to_thread(shutil.rmtree, target_path)
             logger.info(f"Folder deleted: {path_param}")
         else:
-            target_path.unlink()
+            await asyncio.to_thread(target_path.unlink)
             logger.info(f"File deleted: {path_param}")
         
-        return JSONResponse({
+        return ORJSONResponse({
             "success": True,
             "message": "Deleted successfully",
         })
-    except Exception as e:
+    except (OSError, ValueError) as e:
         logger.error(f"Error deleting path: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             {"success": False, "error": str(e)},
             status_code=500
         )
 
 
+async def handle_unexpected_error(request, exc):
+    """Report errors the endpoints don't handle in the same JSON shape as handled ones."""
+    logger.error(f"Unhandled error in {request.method} {request.url.path}: {exc!r}")
+    return ORJSONResponse(
+        {"success": False, "error": str(exc)},
+        status_code=500
+    )
+
+
 routes = [
     Route("/", homepage),
     Route("/files", files_page),
-    Route("/api/config", get_config_endpoint, methods=["GET"]),
-    Route("/api/config", update_config_endpoint, methods=["POST"]),
+    Route("/api/config", config_endpoint, methods=["GET", "POST"]),
     Route("/api/agent/status", get_agent_status, methods=["GET"]),
     Route("/api/agent/start", start_agent, methods=["POST"]),
     Route("/api/agent/stop", stop_agent, methods=["POST"]),
@@ -653,19 +1055,49 @@ routes = [
     Route("/api/files/write", write_file, methods=["POST"]),
     Route("/api/files/create-folder", create_folder, methods=["POST"]),
     Route("/api/files/delete", delete_path, methods=["POST"]),
-    Mount("/static", StaticFiles(directory=str(CURRENT_DIR / "static")), name="static"),
 ]
 
 
 # Enable debug mode via environment variable for development
 DEBUG_MODE = os.environ.get("SLEEPLESS_WEBUI_DEBUG", "false").lower() == "true"
 
-# Add basic auth middleware
+# Number of uvicorn worker processes; raise it for CPU-bound concurrent requests
+WEBUI_WORKERS = int(os.environ.get("SLEEPLESS_WEBUI_WORKERS", "1"))
+
+# Responses smaller than this are sent uncompressed
+GZIP_MINIMUM_SIZE = 512
+
+# Add basic auth middleware. GZip sits inside it so it sees complete response
+# bodies; BaseHTTPMiddleware re-streams them, which would defeat minimum_size.
 middleware = [
-    Middleware(BasicAuthMiddleware)
+    Middleware(BasicAuthMiddleware),
+    Middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE),
 ]
 
-app = Starlette(debug=DEBUG_MODE, routes=routes, middleware=middleware)
+# Static files are mounted beside the protected app, so they never pass through auth
+protected_app = Starlette(
+    debug=DEBUG_MODE,
+    routes=routes,
+    middleware=middleware,
+    exception_handlers={Exception: handle_unexpected_error},
+)
+static_app = GZipMiddleware(StaticFiles(directory=str(CURRENT_DIR / "static")), minimum_size=GZIP_MINIMUM_SIZE)
+app = Starlette(
+    debug=DEBUG_MODE,
+    routes=[
+        Mount("/static", static_app, name="static"),
+        Mount("/", protected_app),
+    ],
+)
+
+
+def _handle_sighup(signum, frame) -> None:
+    """Forget the cached config path and everything derived from it."""
+    global _CONFIG_CACHE, _WORKSPACE_CACHE
+    get_config_path.cache_clear()
+    _CONFIG_CACHE = None
+    _WORKSPACE_CACHE = None
+    logger.info("Configuration caches cleared (SIGHUP)")
 
 
 def run_server(host: str = "127.0.0.1", port: int = 8080):
@@ -675,12 +1107,29 @@ def run_server(host: str = "127.0.0.1", port: int = 8080):
     logger.info(f"Starting web UI server at http://{host}:{port}")
     logger.info(f"Configuration file: {get_config_path()}")
     
+    # SIGHUP drops the cached config path and parsed config without a restart
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, _handle_sighup)
+    
     if WEBUI_PASSWORD:
         logger.info(f"Basic authentication enabled (username: {WEBUI_USERNAME})")
     else:
         logger.warning("Basic authentication disabled - set WEBUI_PASSWORD to enable")
     
-    uvicorn.run(app, host=host, port=port, log_level="info")
+    # uvloop is unavailable on Windows, where uvicorn falls back to asyncio
+    loop = "asyncio" if sys.platform == "win32" else "uvloop"
+    # Multiple workers need an import string so each process can load the app
+    target = "sleepless_agent.interfaces.web_ui.app:app" if WEBUI_WORKERS > 1 else app
+    
+    uvicorn.run(
+        target,
+        host=host,
+        port=port,
+        log_level="info",
+        loop=loop,
+        http="httptools",
+        workers=WEBUI_WORKERS,
+    )
 
 
 if __name__ == "__main__":
@@ -12,8 +12,12 @@ async function loadFiles(path = "") {
     fileList.innerHTML = '<div class="loading">Loading...</div>';
     
     try {
-        const response = await fetch(`/api/files/browse?path=${encodeURIComponent(path)}`);
-        const data = await response.json();
+        const response = await fetch(`/api/files/browse?path=${encodeURIComponent(path)}`, {
+            headers: {
+                'Accept': 'application/x-ndjson, application/json'
+            }
+        });
+        const data = await parseListing(response);
         
         if (data.success) {
             currentPath = path;
@@ -29,6 +33,20 @@ async function loadFiles(path = "") {
     }
 }
 
+// Parse a directory listing, which large folders send as NDJSON
+// (a header line followed by one line per item)
+async function parseListing(response) {
+    const contentType = response.headers.get('Content-Type') || '';
+    if (!contentType.startsWith('application/x-ndjson')) {
+        return response.json();
+    }
+    
+    const lines = (await response.text()).split('\n').filter(line => line);
+    const data = JSON.parse(lines[0]);
+    data.items = lines.slice(1).map(line => JSON.parse(line));
+    return data;
+}
+
 // Render file list
 function renderFileList(data) {
     const fileList = document.getElementById('file-list');
@@ -150,7 +168,9 @@ function updateBreadcrumb(path) {
 async function editFile(path) {
     try {
         const response = await fetch(`/api/files/read?path=${encodeURIComponent(path)}`);
-        const data = await response.json();
+        // Large files are streamed back as plain text instead of JSON
+        const isJson = (response.headers.get('Content-Type') || '').startsWith('application/json');
+        const data = isJson ? await response.json() : { success: response.ok, content: await response.text() };
         
         if (data.success) {
             document.getElementById('editor-title').textContent = `Edit: ${path.split('/').pop()}`;
@@ -175,12 +195,13 @@ async function saveFile() {
     saveBtn.textContent = '💾 Saving...';
     
     try {
-        const response = await fetch('/api/files/write', {
+        // Send the raw content so the server can stream it to disk
+        const response = await fetch(`/api/files/write?path=${encodeURIComponent(path)}`, {
             method: 'POST',
             headers: {
-                'Content-Type': 'application/json'
+                'Content-Type': 'text/plain; charset=utf-8'
             },
-            body: JSON.stringify({ path, content })
+            body: content
         });
         
         const data = await response.json();